@@ -59,14 +59,17 @@ def write_results_csv(catches: list, output_file: str) -> int:
         "evaluated_at"
     ]
 
+    evaluated_at = datetime.now(timezone.utc).isoformat()
+
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
 
         for catch in catches:
-            row = {k: catch.get(k, "") for k in fieldnames}
-            row["evaluated_at"] = datetime.now(timezone.utc).isoformat()
-            writer.writerow(row)
+            writer.writerow([
+                evaluated_at if k == "evaluated_at" else catch.get(k, "")
+                for k in fieldnames
+            ])
 
     logger.info(f"Wrote {len(catches)} catches to {output_file}")
     return len(catches)
@@ -81,14 +81,21 @@ def write_results_csv(
 
     os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
-    # Load existing entries to deduplicate
+    # Load existing entries to deduplicate. Rows stay as lists and are
+    # re-projected onto fieldnames by column index when rewriting.
     existing_urls = set()
     existing_rows = []
+    existing_header = []
     if os.path.exists(output_file):
         with open(output_file, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            existing_header = next(reader, [])
+            url_idx = existing_header.index("comment_url") if "comment_url" in existing_header else None
             for row in reader:
-                url = row.get("comment_url", "")
+                # Skip blank lines, as DictReader did
+                if not row:
+                    continue
+                url = row[url_idx] if url_idx is not None and url_idx < len(row) else ""
                 if url not in existing_urls:
                     existing_urls.add(url)
                     existing_rows.append(row)
@@ -107,17 +114,25 @@ def write_results_csv(
         logging.info("No new catches to write (all already exist)")
         return 0
 
+    # Map each output column to its index in the existing file (None if absent)
+    column_idx = [
+        existing_header.index(k) if k in existing_header else None
+        for k in fieldnames
+    ]
+
     # Rewrite entire file (existing deduped + new)
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
 
         for row in existing_rows:
-            writer.writerow({k: row.get(k, "") for k in fieldnames})
+            writer.writerow([
+                row[i] if i is not None and i < len(row) else ""
+                for i in column_idx
+            ])
 
         for catch in new_catches:
-            row = {k: (catch.get(k) or "") for k in fieldnames}
-            writer.writerow(row)
+            writer.writerow([catch.get(k) or "" for k in fieldnames])
 
     logging.info(f"Appended {len(new_catches)} new catches to {output_file} (skipped {len(catches) - len(new_catches)} duplicates)")
     return len(new_catches)
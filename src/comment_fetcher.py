@@ -9,6 +9,14 @@ from .github_client import GitHubClient
 from .models import GreptileComment, PRWithGreptileComments, RepoConfig, RepoState
 
 
+# Common patterns for Greptile scores, tried in priority order
+SCORE_PATTERNS = [
+    re.compile(r'[Cc]onfidence(?:\s+score)?[:\s]+(\d)/5'),
+    re.compile(r'[Ss]core[:\s]+(\d)/5'),
+    re.compile(r'(?:^|[\s:])(\d)/5'),
+]
+
+
 def extract_score(comment_body: str) -> Optional[int]:
     """Extract confidence score from Greptile comment body.
 
@@ -21,15 +29,8 @@ def extract_score(comment_body: str) -> Optional[int]:
     if not comment_body:
         return None
 
-    # Common patterns for Greptile scores
-    patterns = [
-        r'[Cc]onfidence(?:\s+score)?[:\s]+(\d)/5',
-        r'[Ss]core[:\s]+(\d)/5',
-        r'(?:^|[\s:])(\d)/5',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, comment_body)
+    for pattern in SCORE_PATTERNS:
+        match = pattern.search(comment_body)
         if match:
             return int(match.group(1))
 
@@ -201,8 +202,7 @@ class CommentFetcher:
             comments[idx].reply_body = reply_body
 
         # Fetch file patches for comments that have file_path
-        files_needed = set(c.file_path for c in comments if c.file_path)
-        if files_needed:
+        if any(c.file_path for c in comments):
             file_patches = self.client.get_pr_files(owner, repo, pr_number)
             for comment in comments:
                 if comment.file_path and comment.file_path in file_patches:
@@ -108,6 +108,8 @@ def append_evaluated_comments_csv(
     # Check if file exists to determine if we need header
     file_exists = output_path.exists()
 
+    evaluated_at = datetime.now(timezone.utc).isoformat()
+
     with open(output_path, "a", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
 
@@ -128,7 +130,7 @@ def append_evaluated_comments_csv(
                 "severity": comment.get("severity", ""),
                 "quality_score": comment.get("quality_score", ""),
                 "llm_reasoning": comment.get("llm_reasoning", ""),
-                "evaluated_at": datetime.now(timezone.utc).isoformat()
+                "evaluated_at": evaluated_at
             })
 
     logger.info(f"Appended {len(evaluated_comments)} quality catches to {output_file}")
@@ -3,13 +3,17 @@
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, Generator, Optional
+from typing import Any, Dict, Generator, Optional, Tuple
 
 import requests
 
 from .constants import GREPTILE_BOT_NAMES
 
+# Lowercased once for case-insensitive login matching
+GREPTILE_LOGINS = tuple(name.lower() for name in GREPTILE_BOT_NAMES)
+
 
 class GitHubClient:
     """Handles GitHub API interactions with rate limiting and pagination."""
@@ -74,13 +78,9 @@ class GitHubClient:
                 yield data
                 break
 
-            url = None
-            link_header = response.headers.get("Link", "")
-            for link in link_header.split(","):
-                if 'rel="next"' in link:
-                    url = link.split(";")[0].strip("<> ")
-                    params = {}
-                    break
+            # Follow the Link header; the next URL already carries the query params
+            url = response.links.get("next", {}).get("url")
+            params = {}
 
     def _request(
         self,
@@ -190,10 +190,7 @@ class GitHubClient:
         if not user:
             return False
         login = user.get("login", "").lower()
-        return any(
-            bot_name.lower() in login
-            for bot_name in GREPTILE_BOT_NAMES
-        )
+        return any(bot_name in login for bot_name in GREPTILE_LOGINS)
 
     def get_pr_files(
         self,
@@ -231,11 +228,13 @@ class GitHubClient:
 
     def enrich_comments_batch(
         self,
-        comments: list
+        comments: list,
+        max_workers: int = 4
     ) -> list:
         """Enrich multiple comments with GitHub context.
 
-        Groups comments by PR to minimize API calls.
+        Groups comments by PR to minimize API calls, and fetches the context
+        for several PRs concurrently since each needs multiple round trips.
         Uses the same pattern as comment_fetcher.py: iterate through all
         GitHub review comments once, build a complete index of Greptile
         comments with their html_url and replies, then match DB comments.
@@ -251,54 +250,72 @@ class GitHubClient:
         enriched = []
         total_prs = len(pr_comments)
 
-        for i, (pr_key, pr_comment_list) in enumerate(pr_comments.items()):
-            self.logger.info(f"Enriching PR {i+1}/{total_prs}: {pr_key}")
-
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Fetch context once per PR
-            first_comment = pr_comment_list[0]
-            repo = first_comment.get("repo", "")
-            pr_number = first_comment.get("pr_number")
+            futures = {}
+            for pr_key, pr_comment_list in pr_comments.items():
+                first_comment = pr_comment_list[0]
+                repo = first_comment.get("repo", "")
+                if "/" not in repo:
+                    continue
+                owner, repo_name = repo.split("/", 1)
+                futures[pr_key] = executor.submit(
+                    self._fetch_pr_context,
+                    owner, repo_name, first_comment.get("pr_number")
+                )
+
+            for i, (pr_key, pr_comment_list) in enumerate(pr_comments.items()):
+                self.logger.info(f"Enriching PR {i+1}/{total_prs}: {pr_key}")
+
+                future = futures.get(pr_key)
+                if future is None:
+                    enriched.extend(pr_comment_list)
+                    continue
 
-            if "/" not in repo:
-                enriched.extend(pr_comment_list)
-                continue
+                pr_details, file_patches, greptile_index = future.result()
 
-            owner, repo_name = repo.split("/", 1)
-
-            # Get PR details and files once
-            pr_details = self.get_pr_details(owner, repo_name, pr_number)
-            file_patches = self.get_pr_files(owner, repo_name, pr_number)
-
-            # Build index of all Greptile comments from GitHub API
-            # Same pattern as comment_fetcher.py: single pass, extract URLs and replies
-            all_review_comments = list(self.get_pr_review_comments(owner, repo_name, pr_number))
-            greptile_index = self._build_greptile_comment_index(all_review_comments)
-
-            for comment in pr_comment_list:
-                # Add PR details
-                if pr_details:
-                    comment["pr_title"] = pr_details.get("title", comment.get("pr_title"))
-                    comment["pr_state"] = pr_details.get("state", comment.get("pr_state"))
-                    comment["pr_url"] = pr_details.get("html_url", comment.get("pr_url"))
-
-                # Add file patch
-                file_path = comment.get("file_path")
-                if file_path:
-                    comment["file_patch"] = file_patches.get(file_path, "")
-
-                # Match this DB comment to a GitHub comment by body
-                db_body = comment.get("comment_body", "")
-                matched = self._match_db_comment_to_github(db_body, greptile_index)
-                if matched:
-                    comment["comment_url"] = matched["html_url"]
-                    comment["reply_body"] = matched.get("reply_body")
-                else:
-                    comment["reply_body"] = None
+                for comment in pr_comment_list:
+                    # Add PR details
+                    if pr_details:
+                        comment["pr_title"] = pr_details.get("title", comment.get("pr_title"))
+                        comment["pr_state"] = pr_details.get("state", comment.get("pr_state"))
+                        comment["pr_url"] = pr_details.get("html_url", comment.get("pr_url"))
+
+                    # Add file patch
+                    file_path = comment.get("file_path")
+                    if file_path:
+                        comment["file_patch"] = file_patches.get(file_path, "")
 
-                enriched.append(comment)
+                    # Match this DB comment to a GitHub comment by body
+                    db_body = comment.get("comment_body", "")
+                    matched = self._match_db_comment_to_github(db_body, greptile_index)
+                    if matched:
+                        comment["comment_url"] = matched["html_url"]
+                        comment["reply_body"] = matched.get("reply_body")
+                    else:
+                        comment["reply_body"] = None
+
+                    enriched.append(comment)
 
         return enriched
 
+    def _fetch_pr_context(
+        self,
+        owner: str,
+        repo: str,
+        pr_number: int
+    ) -> Tuple[Optional[Dict[str, Any]], Dict[str, str], list]:
+        """Fetch PR details, file patches and the Greptile comment index for one PR."""
+        pr_details = self.get_pr_details(owner, repo, pr_number)
+        file_patches = self.get_pr_files(owner, repo, pr_number)
+
+        # Build index of all Greptile comments from GitHub API
+        # Same pattern as comment_fetcher.py: single pass, extract URLs and replies
+        all_review_comments = list(self.get_pr_review_comments(owner, repo, pr_number))
+        greptile_index = self._build_greptile_comment_index(all_review_comments)
+
+        return pr_details, file_patches, greptile_index
+
     def _build_greptile_comment_index(
         self,
         all_review_comments: list
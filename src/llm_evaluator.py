@@ -3,6 +3,7 @@
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 import anthropic
@@ -870,15 +871,18 @@ Respond with JSON only:
 
     def evaluate_addressed_comments(
         self,
-        comments: List[Dict[str, Any]]
+        comments: List[Dict[str, Any]],
+        max_workers: int = 4
     ) -> List[Dict[str, Any]]:
         """Evaluate a list of addressed comments from the DB.
 
         Groups comments by PR and evaluates together to handle duplicates.
-        Returns at most 1 catch per PR (the best one).
+        Returns at most 1 catch per PR (the best one). PRs are evaluated
+        concurrently since each is an independent, network-bound LLM call.
 
         Args:
             comments: List of comment dicts from fetch_addressed_comments()
+            max_workers: Maximum number of concurrent LLM requests
 
         Returns:
             List of showcase-worthy catches (quality_score >= min_quality_score)
@@ -897,32 +901,42 @@ Respond with JSON only:
 
         quality_catches = []
 
-        for i, (pr_key, pr_comment_list) in enumerate(pr_comments.items()):
-            self.logger.info(
-                f"Evaluating PR {i+1}/{len(pr_comments)}: {pr_key} "
-                f"({len(pr_comment_list)} comments)"
-            )
-
-            if len(pr_comment_list) == 1:
-                # Single comment - evaluate directly
-                result = self.evaluate_addressed_comment(pr_comment_list[0])
-            else:
-                # Multiple comments - evaluate together to deduplicate
-                result = self._evaluate_addressed_pr_batch(pr_comment_list)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map() yields results in submission order, keeping output stable
+            results = executor.map(self._evaluate_addressed_pr, pr_comments.values())
 
-            if result:
-                quality_catches.append(result)
+            for i, ((pr_key, pr_comment_list), result) in enumerate(
+                zip(pr_comments.items(), results)
+            ):
                 self.logger.info(
-                    f"  -> Quality catch! Score: {result['quality_score']}, "
-                    f"Category: {result['bug_category']}"
+                    f"Evaluated PR {i+1}/{len(pr_comments)}: {pr_key} "
+                    f"({len(pr_comment_list)} comments)"
                 )
 
+                if result:
+                    quality_catches.append(result)
+                    self.logger.info(
+                        f"  -> Quality catch! Score: {result['quality_score']}, "
+                        f"Category: {result['bug_category']}"
+                    )
+
         self.logger.info(
             f"Evaluated {len(pr_comments)} PRs ({len(comments)} comments), "
             f"found {len(quality_catches)} showcase-worthy (score >= {self.min_quality_score})"
         )
         return quality_catches
 
+    def _evaluate_addressed_pr(
+        self,
+        comments: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Evaluate all addressed comments for one PR."""
+        if len(comments) == 1:
+            # Single comment - evaluate directly
+            return self.evaluate_addressed_comment(comments[0])
+        # Multiple comments - evaluate together to deduplicate
+        return self._evaluate_addressed_pr_batch(comments)
+
     def _evaluate_addressed_pr_batch(
         self,
         comments: List[Dict[str, Any]]
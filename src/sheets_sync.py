@@ -4,9 +4,10 @@ import csv
 import logging
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
 
 import gspread
+from gspread.utils import ValueInputOption
 from google.oauth2.service_account import Credentials
 
 
@@ -17,6 +18,20 @@ SCOPES = [
 
 DEFAULT_SPREADSHEET_ID = "15SoQrckKQoD_BPJkkwB0D3NwjRlIyn0W5O9UQtWVmM0"
 
+# Column order for catch worksheets (consistent with CSV output)
+CATCH_HEADERS = [
+    "repo", "pr_number", "pr_title", "pr_url",
+    "comment_body", "comment_url", "reply_body", "created_at",
+    "title", "bug_category", "severity", "quality_score", "llm_reasoning",
+    "evaluated_at"
+]
+
+# Smallest grid to allocate for a new worksheet
+MIN_WORKSHEET_ROWS = 100
+
+# Max rows per write request, keeps payloads under the Sheets request size limit
+APPEND_CHUNK_SIZE = 500
+
 
 class SheetsSync:
     """Syncs quality bug catches to Google Sheets."""
@@ -61,6 +76,43 @@ class SheetsSync:
             self._spreadsheet = client.open_by_key(self.spreadsheet_id)
         return self._spreadsheet
 
+    def _add_worksheet(self, worksheet_name: str, rows: int) -> gspread.Worksheet:
+        """Create a catch worksheet sized for the rows about to be written."""
+        worksheet = self._get_spreadsheet().add_worksheet(
+            title=worksheet_name,
+            rows=max(rows, MIN_WORKSHEET_ROWS),
+            cols=len(CATCH_HEADERS)
+        )
+        self.logger.info(f"Created new worksheet: {worksheet_name}")
+        return worksheet
+
+    def _catch_values(self, catches: list) -> List[List[str]]:
+        """Project catch dicts onto CATCH_HEADERS as sheet rows."""
+        return [[str(c.get(h) or "") for h in CATCH_HEADERS] for c in catches]
+
+    def _append_rows(self, worksheet: gspread.Worksheet, values: List[list]) -> None:
+        """Append rows in fixed-size chunks so large syncs stay within request limits."""
+        for start in range(0, len(values), APPEND_CHUNK_SIZE):
+            worksheet.append_rows(
+                values[start:start + APPEND_CHUNK_SIZE],
+                value_input_option=ValueInputOption.raw
+            )
+
+    def _cell_rows(self, rows: List[List[str]]) -> List[dict]:
+        """Convert value rows to RowData for an updateCells request."""
+        return [
+            {"values": [{"userEnteredValue": {"stringValue": v}} for v in row]}
+            for row in rows
+        ]
+
+    def _existing_comment_urls(self, worksheet: gspread.Worksheet) -> Set[str]:
+        """Read only the comment_url column of a worksheet for deduplication."""
+        headers = worksheet.row_values(1)
+        if "comment_url" not in headers:
+            return set()
+        col = headers.index("comment_url") + 1
+        return set(worksheet.col_values(col)[1:])
+
     def sync_catches_to_sheet(
         self,
         catches: list,
@@ -81,50 +133,32 @@ class SheetsSync:
 
         spreadsheet = self._get_spreadsheet()
 
+        created = False
         try:
             worksheet = spreadsheet.worksheet(worksheet_name)
         except gspread.WorksheetNotFound:
-            worksheet = spreadsheet.add_worksheet(
-                title=worksheet_name, rows=1000, cols=20
-            )
-            headers = [
-                "repo", "pr_number", "pr_title", "pr_url",
-                "comment_body", "comment_url", "reply_body", "created_at",
-                "title", "bug_category", "severity", "quality_score", "llm_reasoning",
-                "evaluated_at"
-            ]
-            worksheet.append_row(headers)
-            self.logger.info(f"Created new worksheet: {worksheet_name}")
-
-        # Get existing comment_urls to deduplicate
-        existing_data = worksheet.get_all_values()
-        existing_urls = set()
-        if existing_data:
-            headers = existing_data[0]
-            dedup_idx = headers.index("comment_url") if "comment_url" in headers else None
-            if dedup_idx is not None:
-                for row in existing_data[1:]:
-                    if len(row) > dedup_idx:
-                        existing_urls.add(row[dedup_idx])
+            worksheet = self._add_worksheet(worksheet_name, len(catches) + 1)
+            created = True
+
+        # Get existing comment_urls to deduplicate (a new worksheet has none)
+        existing_urls = set() if created else self._existing_comment_urls(worksheet)
 
         new_catches = [
             c for c in catches
             if c.get("comment_url") and str(c["comment_url"]) not in existing_urls
         ]
 
+        values = self._catch_values(new_catches)
+        if created:
+            # Header goes out with the first batch instead of its own request
+            values.insert(0, list(CATCH_HEADERS))
+        if values:
+            self._append_rows(worksheet, values)
+
         if not new_catches:
             self.logger.info("No new catches to sync (all already exist)")
             return 0
 
-        headers = [
-            "repo", "pr_number", "pr_title", "pr_url",
-            "comment_body", "comment_url", "reply_body", "created_at",
-            "title", "bug_category", "severity", "quality_score", "llm_reasoning",
-            "evaluated_at"
-        ]
-        values = [[str(c.get(h) or "") for h in headers] for c in new_catches]
-        worksheet.append_rows(values)
-
         self.logger.info(f"Synced {len(new_catches)} new catches to '{worksheet_name}'")
         return len(new_catches)
 
@@ -160,11 +194,11 @@ class SheetsSync:
 
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
+        # get_all_values() returns rectangular rows, so write them as-is
         with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            for row in rows:
-                writer.writerow(dict(zip(headers, row)))
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            writer.writerows(rows)
 
         self.logger.info(f"Exported {len(rows)} rows from sheet to {output_file}")
         return len(rows)
@@ -176,7 +210,10 @@ class SheetsSync:
     ) -> int:
         """Clear worksheet and sync fresh data.
 
-        Clears all existing data and writes new catches.
+        Clears all existing data and writes new catches. The clear and the
+        first chunk of rows go out in a single batchUpdate request; later
+        chunks are separate requests, so if one of them fails the sheet is
+        left cleared and only partly written.
 
         Args:
             catches: List of catch dicts to write
@@ -195,35 +232,36 @@ class SheetsSync:
         try:
             worksheet = spreadsheet.worksheet(worksheet_name)
         except gspread.WorksheetNotFound:
-            worksheet = spreadsheet.add_worksheet(
-                title=worksheet_name, rows=1000, cols=20
-            )
-            self.logger.info(f"Created new worksheet: {worksheet_name}")
-
-        # Clear all existing data
-        worksheet.clear()
-        self.logger.info(f"Cleared worksheet: {worksheet_name}")
-
-        # Define headers (consistent with CSV output)
-        headers = [
-            "repo", "pr_number", "pr_title", "pr_url",
-            "comment_body", "comment_url", "reply_body", "created_at",
-            "title", "bug_category", "severity", "quality_score", "llm_reasoning",
-            "evaluated_at"
-        ]
-
-        # Write header row
-        worksheet.append_row(headers)
-
-        # Prepare data rows
-        values = []
-        for catch in catches:
-            row = [str(catch.get(h) or "") for h in headers]
-            values.append(row)
-
-        # Batch append all rows
-        if values:
-            worksheet.append_rows(values)
+            worksheet = self._add_worksheet(worksheet_name, len(catches) + 1)
+
+        values = self._catch_values(catches)
+        rows = [list(CATCH_HEADERS)] + values
+        sheet_id = worksheet.id
+
+        # Grow the grid if needed, then clear values (formatting is kept, as
+        # with worksheet.clear()) and write from A1, all in one request
+        missing_rows = len(rows) - worksheet.row_count
+        missing_cols = len(CATCH_HEADERS) - worksheet.col_count
+        batch_requests = []
+        if missing_rows > 0:
+            batch_requests.append({"appendDimension": {
+                "sheetId": sheet_id, "dimension": "ROWS", "length": missing_rows
+            }})
+        if missing_cols > 0:
+            batch_requests.append({"appendDimension": {
+                "sheetId": sheet_id, "dimension": "COLUMNS", "length": missing_cols
+            }})
+        batch_requests.append({"updateCells": {
+            "range": {"sheetId": sheet_id}, "fields": "userEnteredValue"
+        }})
+        for start in range(0, len(rows), APPEND_CHUNK_SIZE):
+            batch_requests.append({"updateCells": {
+                "start": {"sheetId": sheet_id, "rowIndex": start, "columnIndex": 0},
+                "rows": self._cell_rows(rows[start:start + APPEND_CHUNK_SIZE]),
+                "fields": "userEnteredValue"
+            }})
+            spreadsheet.batch_update({"requests": batch_requests})
+            batch_requests = []
 
         self.logger.info(
             f"Wrote {len(values)} catches to '{worksheet_name}'"
@@ -36,7 +36,7 @@ class StateManager:
                 # Convert pr_shas keys back to int (JSON only supports string keys)
                 pr_shas = state_data.get("pr_shas")
                 if pr_shas:
-                    pr_shas = {int(k): v for k, v in pr_shas.items()}
+                    pr_shas = dict(zip(map(int, pr_shas), pr_shas.values()))
                 self.states[repo] = RepoState(
                     repo=repo,
                     last_checked=last_checked,
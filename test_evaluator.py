@@ -8,9 +8,13 @@ Compares LLM quality_score vs human score to identify:
 """
 
 import csv
+import heapq
 import logging
 import os
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from typing import Dict, List, Optional
 
 logging.basicConfig(
@@ -20,20 +24,36 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Sheet columns evaluate_comment() reads from the full comment data
+FULL_COMMENT_FIELDS = (
+    "repo", "pr_number", "pr_title", "pr_url",
+    "comment_body", "comment_url", "created_at"
+)
+
+
+def _cell(row: List[str], idx: Optional[int]) -> str:
+    """Return a CSV cell by column index, or "" if the column is missing."""
+    return row[idx] if idx is not None and idx < len(row) else ""
+
+
 def load_golden_set(golden_csv: str = "output/comment_scores.csv") -> List[Dict]:
     """Load manually-scored comments."""
     comments = []
     with open(golden_csv, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = {name: i for i, name in enumerate(next(reader, []))}
+        url_idx = header.get("comment_url")
+        score_idx = header.get("score")
+        justification_idx = header.get("justification", header.get(" justificationhu"))
         for row in reader:
-            score_str = row.get("score", "").strip()
+            score_str = _cell(row, score_idx).strip()
             if score_str:
                 try:
                     score = int(score_str)
                     comments.append({
-                        "comment_url": row.get("comment_url", "").strip(),
+                        "comment_url": _cell(row, url_idx).strip(),
                         "human_score": score,
-                        "justification": row.get("justification", row.get(" justificationhu", "")).strip()
+                        "justification": _cell(row, justification_idx).strip()
                     })
                 except ValueError:
                     pass
@@ -41,14 +61,20 @@ def load_golden_set(golden_csv: str = "output/comment_scores.csv") -> List[Dict]
 
 
 def load_full_comments(sheet_csv: str = "output/google_sheet_data.csv") -> Dict[str, Dict]:
-    """Load full comment data from sheet export, indexed by comment_url."""
+    """Load full comment data from sheet export, indexed by comment_url.
+
+    Only the columns in FULL_COMMENT_FIELDS are kept per comment.
+    """
     comments = {}
     with open(sheet_csv, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = {name: i for i, name in enumerate(next(reader, []))}
+        url_idx = header.get("comment_url")
+        field_idx = [(name, header.get(name)) for name in FULL_COMMENT_FIELDS]
         for row in reader:
-            url = row.get("comment_url", "").strip()
+            url = _cell(row, url_idx).strip()
             if url:
-                comments[url] = row
+                comments[url] = {name: _cell(row, i) for name, i in field_idx}
     return comments
 
 
@@ -83,17 +109,22 @@ def main():
     full_comments = load_full_comments()
     logger.info(f"Loaded {len(full_comments)} comments from sheet")
 
-    # Match golden set with full data
+    # Match golden set with full data (golden items are ours to update in place)
     matched = []
+    unmatched = []
     for item in golden_set:
-        url = item["comment_url"]
-        if url in full_comments:
-            matched.append({
-                **item,
-                **full_comments[url]
-            })
+        full = full_comments.get(item["comment_url"])
+        if full is not None:
+            item.update(full)
+            matched.append(item)
         else:
-            logger.warning(f"No match for: {url[:80]}...")
+            unmatched.append(item["comment_url"])
+
+    if unmatched:
+        logger.warning(
+            f"No match for {len(unmatched)} comments:\n"
+            + "\n".join(f"  {url[:80]}..." for url in unmatched)
+        )
 
     logger.info(f"Matched {len(matched)} comments")
 
@@ -105,44 +136,45 @@ def main():
     from src.llm_evaluator import LLMEvaluator
     evaluator = LLMEvaluator(min_quality_score=1)
 
-    # Evaluate each comment
+    # Evaluate comments concurrently; each is an independent LLM round trip.
+    # map() yields results in input order, so output matches the golden set.
     results = []
-    for i, comment in enumerate(matched):
-        logger.info(f"Evaluating {i+1}/{len(matched)}: {comment['comment_url'][:60]}...")
-
-        result = evaluate_comment(comment, evaluator)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        evaluations = executor.map(evaluate_comment, matched, repeat(evaluator))
+        for i, (comment, result) in enumerate(zip(matched, evaluations)):
+            logger.info(f"Evaluated {i+1}/{len(matched)}: {comment['comment_url'][:60]}...")
+
+            if result:
+                llm_score = result.get("quality_score", 0)
+            else:
+                llm_score = None
+
+            diff = (llm_score - comment["human_score"]) if llm_score else None
+            results.append({
+                "comment_url": comment["comment_url"],
+                "human_score": comment["human_score"],
+                "llm_score": llm_score,
+                "diff": diff,
+                "human_justification": comment.get("justification", ""),
+                "llm_reasoning": result.get("llm_reasoning", "") if result else "",
+                "bug_category": result.get("bug_category", "") if result else "",
+                "severity": result.get("severity", "") if result else ""
+            })
 
-        if result:
-            llm_score = result.get("quality_score", 0)
-        else:
-            llm_score = None
-
-        results.append({
-            "comment_url": comment["comment_url"],
-            "human_score": comment["human_score"],
-            "llm_score": llm_score,
-            "human_justification": comment.get("justification", ""),
-            "llm_reasoning": result.get("llm_reasoning", "") if result else "",
-            "bug_category": result.get("bug_category", "") if result else "",
-            "severity": result.get("severity", "") if result else ""
-        })
-
-        # Print comparison
-        diff = (llm_score - comment["human_score"]) if llm_score else None
-        status = "✓" if diff is not None and abs(diff) <= 1 else "✗" if diff else "?"
-        logger.info(f"  Human: {comment['human_score']}, LLM: {llm_score}, Diff: {diff} {status}")
+            # Print comparison
+            status = "✓" if diff is not None and abs(diff) <= 1 else "✗" if diff else "?"
+            logger.info(f"  Human: {comment['human_score']}, LLM: {llm_score}, Diff: {diff} {status}")
 
     # Write results
     output_file = "output/evaluator_comparison.csv"
     with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=[
+        fieldnames = [
             "comment_url", "human_score", "llm_score", "diff",
             "human_justification", "llm_reasoning", "bug_category", "severity"
-        ])
-        writer.writeheader()
-        for r in results:
-            r["diff"] = (r["llm_score"] - r["human_score"]) if r["llm_score"] else None
-            writer.writerow(r)
+        ]
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows([r[k] for k in fieldnames] for r in results)
 
     logger.info(f"Results written to {output_file}")
 
@@ -156,9 +188,11 @@ def main():
         diffs = [r["llm_score"] - r["human_score"] for r in valid_results]
         avg_diff = sum(diffs) / len(diffs)
 
-        exact_match = sum(1 for d in diffs if d == 0)
-        within_1 = sum(1 for d in diffs if abs(d) <= 1)
-        within_2 = sum(1 for d in diffs if abs(d) <= 2)
+        # Tally absolute diffs once, then derive the agreement bands
+        abs_diff_counts = Counter(abs(d) for d in diffs)
+        exact_match = abs_diff_counts[0]
+        within_1 = exact_match + abs_diff_counts[1]
+        within_2 = within_1 + abs_diff_counts[2]
 
         # Threshold agreement (both >= 8 or both < 8)
         threshold_agree = sum(
@@ -174,14 +208,14 @@ def main():
         print(f"Threshold agreement (8+): {threshold_agree} ({100*threshold_agree/len(valid_results):.1f}%)")
 
         print("\n--- Score Distribution ---")
+        human_counts = Counter(r["human_score"] for r in valid_results)
+        llm_counts = Counter(r["llm_score"] for r in valid_results)
         for score in range(1, 11):
-            human_count = sum(1 for r in valid_results if r["human_score"] == score)
-            llm_count = sum(1 for r in valid_results if r["llm_score"] == score)
-            print(f"  {score}: Human={human_count}, LLM={llm_count}")
+            print(f"  {score}: Human={human_counts[score]}, LLM={llm_counts[score]}")
 
         print("\n--- Biggest Disagreements ---")
-        sorted_by_diff = sorted(valid_results, key=lambda x: abs(x["llm_score"] - x["human_score"]), reverse=True)
-        for r in sorted_by_diff[:5]:
+        biggest = heapq.nlargest(5, valid_results, key=lambda x: abs(x["llm_score"] - x["human_score"]))
+        for r in biggest:
             diff = r["llm_score"] - r["human_score"]
             print(f"  Human={r['human_score']}, LLM={r['llm_score']} (diff={diff:+d})")
             print(f"    {r['comment_url'][:70]}...")